@@ -1,39 +1,124 @@
 import tkinter as tk
-from tkinter import simpledialog, colorchooser
 from abc import ABC, abstractmethod
-import random, re
+import random
+import heapq
+import logging
 import threading
 import time
 
+log = logging.getLogger(__name__)
+
+# ---------- Colors ----------
+# default fills, built once and handed out round-robin instead of formatting a random hex per object;
+# Knuth's multiplicative hash scatters consecutive entries across the color space
+def _build_palette(size=256):
+    colors = []
+    i = 1
+    while len(colors) < size:
+        v = (i * 2654435761) & 0xFFFFFF
+        r, g, b = v >> 16, (v >> 8) & 0xFF, v & 0xFF
+        # labels use the default black text, so skip fills too dark to read it on
+        if r * 299 + g * 587 + b * 114 >= 128000:
+            colors.append("#%06x" % v)
+        i += 1
+    return tuple(colors)
+
+
+_PALETTE = _build_palette()
+
+
 # ---------- Name allocation ----------
 class NameAllocator:
+    # per type: next never-used number + min-heap of released numbers
     pools = {}
 
     @classmethod
-    def next_name(cls, type_name: str) -> str:
-        pool = cls.pools.setdefault(type_name, {"next": 1, "free": set()})
+    def next_name(cls, type_name: str) -> tuple[str, int]:
+        pool = cls.pools.setdefault(type_name, {"next": 1, "free": []})
         if pool["free"]:
-            n = min(pool["free"])
-            pool["free"].remove(n)
+            n = heapq.heappop(pool["free"])
         else:
             n = pool["next"]
             pool["next"] += 1
-        return f"{type_name}{n}"
+        return f"{type_name}{n}", n
 
     @classmethod
-    def release_name(cls, type_name: str, name: str):
-        m = re.fullmatch(rf"{re.escape(type_name)}(\d+)", name)
-        if not m:
+    def release_num(cls, type_name: str, n: int):
+        pool = cls.pools.setdefault(type_name, {"next": 1, "free": []})
+        if n == pool["next"] - 1:
+            pool["next"] = n  # freeing the top number: shrink instead of growing the heap
+        else:
+            heapq.heappush(pool["free"], n)
+
+
+# ---------- Spatial index ----------
+class SpatialIndex:
+    # uniform grid of visible object centers, bucketed per class;
+    # cell must be >= any query radius
+    def __init__(self, cell=80):
+        self.cell = cell
+        self.cells = {}
+        self.where = {}
+
+    def _key(self, kind, x, y):
+        return kind, int(x // self.cell), int(y // self.cell)
+
+    def update(self, obj, center):
+        key = self._key(type(obj), *center)
+        old = self.where.get(obj)
+        if old == key:
             return
-        n = int(m.group(1))
-        pool = cls.pools.setdefault(type_name, {"next": 1, "free": set()})
-        if n < pool["next"] or n not in pool["free"]:
-            pool["free"].add(n)
+        if old is not None:
+            self.cells[old].discard(obj)
+        self.cells.setdefault(key, set()).add(obj)
+        self.where[obj] = key
+
+    def remove(self, obj):
+        key = self.where.pop(obj, None)
+        if key is not None:
+            self.cells[key].discard(obj)
+
+    def nearby(self, x, y, kind):
+        _, gx, gy = self._key(kind, x, y)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                yield from self.cells.get((kind, gx + dx, gy + dy), ())
+
+    def nearest(self, x, y, kind, max_dist, accept=None):
+        nearest = None
+        nearest_d2 = max_dist * max_dist  # compare squared, no sqrt
+        for obj in self.nearby(x, y, kind):
+            if accept is not None and not accept(obj):
+                continue
+            ox, oy = obj._center_of_shape()
+            dx = x - ox
+            dy = y - oy
+            d2 = dx * dx + dy * dy
+            if d2 < nearest_d2:
+                nearest = obj
+                nearest_d2 = d2
+        return nearest
 
 
 # ---------- Abstract base ----------
 class ClickableObject(ABC):
+    __slots__ = (
+        "app", "canvas", "layer_listbox", "name", "_alloc_id", "color",
+        "shape_id", "label_id", "_group_tag", "_listbox_idx", "_drag_data", "_menu_xy",
+        "_cx", "_cy", "_w", "_h",
+    )
     instances = []
+    # deleted objects per concrete class, handed out again by acquire()
+    pools = {}
+    POOL_SIZE = 64
+    _palette_idx = 0
+    _type_name = None  # allocator key, set per subclass
+    # base context-menu entries; each label maps to the method of the same name
+    _BASE_ACTIONS = ("Recolor", "Rename", "Duplicate", "Delete")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
 
     def __init__(self, app, x, y, name=None, color=None):
         if type(self) is ClickableObject:
@@ -43,57 +128,135 @@ class ClickableObject(ABC):
         self.canvas = app.canvas
         self.layer_listbox = app.layer_listbox
 
-        cls_name = self.__class__.__name__
-        self.name = name or NameAllocator.next_name(cls_name)
-        self.color = color or "#%06x" % random.randint(0, 0xFFFFFF)
-
-        self.shape_id = None
-        self.label_id = None
-
-        self.create_shape(x, y)
-        self._create_or_update_label()
-
+        if name:
+            self.name, self._alloc_id = name, None
+        else:
+            # keep the allocated number so it can be recycled without parsing the name
+            self.name, self._alloc_id = NameAllocator.next_name(self._type_name)
+        if not color:
+            color = _PALETTE[ClickableObject._palette_idx % len(_PALETTE)]
+            ClickableObject._palette_idx += 1
+        self.color = color
+
+        if getattr(self, "shape_id", None) is None:
+            self.shape_id = None
+            self.label_id = None
+            # every canvas item that moves with this object carries _group_tag
+            self._group_tag = f"obj{id(self)}"
+            self._place(x, y)
+            self.create_shape(x, y)
+            self._create_or_update_label()
+            self.app.item_owner[self.shape_id] = self
+            self.app.item_owner[self.label_id] = self
+        else:
+            # recycled by acquire(): the hidden canvas items are reused
+            self._place(x, y)
+            self._reset_shape(x, y)
+            self._create_or_update_label()
+            # a new object would be created on top; don't leave the reused one buried
+            self.canvas.tag_raise(self._group_tag)
+        if self._SHAPE_STYLE.get("width", 1) != 1:
+            self.app.wide_outlines = True  # e.g. a Bag: the next selection must reset it
+        self.app.spatial.update(self, self._center_of_shape())
+
+        # position in instances / layer_listbox, kept in sync by _unregister()
+        self._listbox_idx = len(ClickableObject.instances)
         ClickableObject.instances.append(self)
         self.layer_listbox.insert(tk.END, self.name)
 
-        for obj_id in (self.shape_id, self.label_id):
-            self.canvas.tag_bind(obj_id, "<Button-3>", self.show_menu)
-            self.canvas.tag_bind(obj_id, "<Button-1>", self.on_select)
-            self.canvas.tag_bind(obj_id, "<B1-Motion>", self.do_drag)
+        # dx/dy accumulate motion events until the next idle flush
+        self._drag_data = {"x": 0, "y": 0, "dx": 0, "dy": 0, "pending": False}
 
-        self._drag_data = {"x": 0, "y": 0}
+    @classmethod
+    def acquire(cls, app, x, y, **kwargs):
+        pool = ClickableObject.pools.get(cls)
+        if pool:
+            obj = pool.pop()
+            obj.__init__(app, x, y, **kwargs)
+            return obj
+        return cls(app, x, y, **kwargs)
 
     @abstractmethod
     def create_shape(self, x, y):
         pass
 
     # ------- helpers -------
+    def _shape_tags(self):
+        # passed at creation: "clickable" routes mouse events through App's tag bindings,
+        # "selectable" lets App reset every outline with a single itemconfig
+        return "clickable", self._group_tag, "selectable"
+
+    def _place(self, x, y):
+        # cached geometry, so positions never need a canvas.bbox round-trip
+        x1, y1, x2, y2 = self._shape_coords(x, y)
+        self._w, self._h = x2 - x1, y2 - y1
+        self._cx, self._cy = x1 + self._w / 2, y1 + self._h / 2
+
+    def _bbox(self):
+        hw, hh = self._w / 2, self._h / 2
+        return self._cx - hw, self._cy - hh, self._cx + hw, self._cy + hh
+
     def _center_of_shape(self):
-        x1, y1, x2, y2 = self.canvas.bbox(self.shape_id)
-        return (x1 + x2) / 2, (y1 + y2) / 2
+        return self._cx, self._cy
+
+    def _move_to(self, x, y):
+        self._place(x, y)
+        self.canvas.coords(self.shape_id, *self._shape_coords(x, y))
+        self.canvas.coords(self.label_id, self._cx, self._cy)
+
+    def _move_by(self, dx, dy):
+        self.canvas.move(self._group_tag, dx, dy)
+        self._cx += dx
+        self._cy += dy
+        self.app.spatial.update(self, (self._cx, self._cy))
 
     def _create_or_update_label(self):
-        cx, cy = self._center_of_shape()
+        cx, cy = self._cx, self._cy
         if self.label_id is None:
-            self.label_id = self.canvas.create_text(cx, cy, text=self.name)
+            self.label_id = self.canvas.create_text(cx, cy, text=self.name, tags=("clickable", self._group_tag))
         else:
             self.canvas.coords(self.label_id, cx, cy)
             self.canvas.itemconfig(self.label_id, text=self.name)
 
     def _current_index(self):
-        return ClickableObject.instances.index(self)
+        return self._listbox_idx
+
+    def _release_alloc_id(self):
+        if self._alloc_id is not None:
+            NameAllocator.release_num(self._type_name, self._alloc_id)
+            self._alloc_id = None
+
+    def _reset_shape(self, x, y):
+        self.canvas.coords(self.shape_id, *self._shape_coords(x, y))
+        self.canvas.itemconfigure(self.shape_id, fill=self.color, state="normal", **self._SHAPE_STYLE)
+        self.canvas.itemconfigure(self.label_id, state="normal")
+
+    def _recycle(self):
+        pool = ClickableObject.pools.setdefault(type(self), [])
+        if len(pool) < ClickableObject.POOL_SIZE:
+            self.canvas.itemconfigure(self._group_tag, state="hidden")
+            pool.append(self)
+        else:
+            self.canvas.delete(self._group_tag)  # shape and label in one call
+            del self.app.item_owner[self.shape_id]
+            del self.app.item_owner[self.label_id]
+
+    def _unregister(self):
+        idx = self._listbox_idx
+        self._listbox_idx = None  # makes a second delete() a no-op
+        del ClickableObject.instances[idx]
+        for obj in ClickableObject.instances[idx:]:
+            obj._listbox_idx -= 1
+        self.app.mark_layers_dirty()
 
     # ------- context menu -------
     def build_base_menu(self, event):
-        menu = tk.Menu(self.canvas, tearoff=0)
-        actions = {
-            "Recolor": self.recolor,
-            "Rename": self.rename,
-            "Duplicate": lambda: self.duplicate(event.x + 20, event.y + 20),
-            "Delete": self.delete
-        }
-        for label, action in actions.items():
-            menu.add_command(label=label, command=action)
+        # one menu widget is shared by all objects; only its entries are rebuilt
+        menu = self.app.context_menu
+        menu.delete(0, tk.END)
+        self._menu_xy = (event.x + 20, event.y + 20)  # where Duplicate drops the copy
+        for label in self._BASE_ACTIONS:
+            menu.add_command(label=label, command=getattr(self, label.lower()))
         return menu
 
     def show_menu(self, event):
@@ -104,41 +267,42 @@ class ClickableObject(ABC):
         menu.post(event.x_root, event.y_root)
 
     def recolor(self):
+        from tkinter import colorchooser  # dialogs are loaded on first use, not at startup
         color = colorchooser.askcolor(title="Choose new color", initialcolor=self.color)
-        if color and color[1]:
+        if color and color[1] and color[1] != self.color:
             self.color = color[1]
             self.canvas.itemconfig(self.shape_id, fill=self.color)
 
     def rename(self):
+        from tkinter import simpledialog  # dialogs are loaded on first use, not at startup
         old_name = self.name
         new_name = simpledialog.askstring("Rename", f"Enter new name for {self.name}:", initialvalue=self.name)
         if not new_name or new_name == old_name:
             return
-        NameAllocator.release_name(self.__class__.__name__, old_name)
+        self._release_alloc_id()
         self.name = new_name
-        self._create_or_update_label()
-        idx = self._current_index()
-        self.layer_listbox.delete(idx)
-        self.layer_listbox.insert(idx, self.name)
+        # the label already sits at the center; only its text changes
+        self.canvas.itemconfig(self.label_id, text=self.name)
+        self.app.mark_layers_dirty()
 
-    def duplicate(self, x, y):
-        new_obj = self.__class__(self.app, x, y, color=self.color)
-        new_obj._create_or_update_label()
+    def duplicate(self, x=None, y=None):
+        if x is None:
+            x, y = self._menu_xy
+        self.__class__.acquire(self.app, x, y, color=self.color)
 
     def delete(self):
-        self.canvas.delete(self.shape_id)
-        self.canvas.delete(self.label_id)
-        NameAllocator.release_name(self.__class__.__name__, self.name)
-        if self in ClickableObject.instances:
-            idx = self._current_index()
-            ClickableObject.instances.remove(self)
-            self.layer_listbox.delete(idx)
+        self._drag_data["pending"] = False
+        self._release_alloc_id()
+        self.app.spatial.remove(self)
+        if self.app.selected_obj is self:
+            self.app.selected_obj = None
+        if self._listbox_idx is not None:
+            self._unregister()
+            self._recycle()
 
     # --- Selection + Dragging ---
     def on_select(self, event):
-        for obj in ClickableObject.instances:
-            self.canvas.itemconfig(obj.shape_id, width=1)
-        self.canvas.itemconfig(self.shape_id, width=3)
+        self.app.set_selected(self)
         idx = self._current_index()
         self.layer_listbox.selection_clear(0, tk.END)
         self.layer_listbox.selection_set(idx)
@@ -147,12 +311,27 @@ class ClickableObject(ABC):
         self._drag_data["y"] = event.y
 
     def do_drag(self, event):
-        dx = event.x - self._drag_data["x"]
-        dy = event.y - self._drag_data["y"]
-        self.canvas.move(self.shape_id, dx, dy)
-        self.canvas.move(self.label_id, dx, dy)
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        data = self._drag_data
+        if event.x == data["x"] and event.y == data["y"]:
+            return  # touchpads repeat motion events without moving
+        data["dx"] += event.x - data["x"]
+        data["dy"] += event.y - data["y"]
+        data["x"] = event.x
+        data["y"] = event.y
+        if not data["pending"]:
+            # B1-Motion can fire far faster than we can redraw; move once per idle tick
+            data["pending"] = True
+            self.canvas.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        data = self._drag_data
+        if not data["pending"]:
+            return  # deleted while the flush was queued
+        dx, dy = data["dx"], data["dy"]
+        data["dx"] = data["dy"] = 0
+        data["pending"] = False
+        if dx or dy:  # motion within the tick may have cancelled out
+            self._move_by(dx, dy)
 
 
 # ---------- Concrete shapes ----------
@@ -160,19 +339,26 @@ from tkinter import messagebox
 
 
 class Bag(ClickableObject):
+    __slots__ = ("is_open", "attached_scanner", "max_items", "items", "_items_set")
+    _SHAPE_STYLE = {"outline": "red", "width": 3}  # closed by default
+
     def __init__(self, app, x, y, name=None, color=None, max_items=5):
         self.is_open = False
         self.attached_scanner = None
         self.max_items = max_items
         self.items = []  # hold attached items
+        self._items_set = set()  # membership checks without scanning items
         super().__init__(app, x, y, name, color)
 
+    def _shape_coords(self, x, y):
+        return x, y, x + 80, y + 80
+
     def create_shape(self, x, y):
         self.shape_id = self.canvas.create_rectangle(
-            x, y, x + 80, y + 80,
+            *self._shape_coords(x, y),
             fill=self.color,
-            outline="red",  # closed by default
-            width=3
+            tags=self._shape_tags(),
+            **self._SHAPE_STYLE
         )
 
     # ---------- open/close ----------
@@ -194,13 +380,14 @@ class Bag(ClickableObject):
         if len(self.items) >= self.max_items:
             messagebox.showwarning("Bag", f"Bag limit reached! (max {self.max_items})")
             return
-        if item in self.items:
+        if item in self._items_set:
             messagebox.showinfo("Bag", f"{item.name} is already inside {self.name}")
             return
 
         self.items.append(item)
+        self._items_set.add(item)
         item.hide()
-        messagebox.showinfo("Bag", f"{item.name} added to {self.name}")
+        self.app.set_status(f"{item.name} added to {self.name}")
 
         # ---- RFID scan integration ----
         if self.attached_scanner and item.attached_tag:
@@ -208,17 +395,19 @@ class Bag(ClickableObject):
             self.attached_scanner.add_rfid_from_bag(rfid, self)
 
     def remove_item(self, item):
-        if item in self.items:
+        if item in self._items_set:
             self.items.remove(item)
+            self._items_set.discard(item)
 
             # ---- RFID removal for bag ----
             if self.attached_scanner and item.attached_tag:
                 self.attached_scanner.remove_rfids_from_bag(self)
 
-            x1, y1, x2, y2 = self.canvas.bbox(self.shape_id)
+            x1, y1, x2, y2 = self._bbox()
             cx = x2 + 30
             cy = (y1 + y2) / 2
             item.show(cx, cy)
+            self.app.set_status("")  # an earlier "added to" message is no longer true
 
     def remove_all_items(self):
         if self.attached_scanner:
@@ -229,23 +418,23 @@ class Bag(ClickableObject):
     # ---------- scanner attach/remove ----------
     def add_scanner(self, scanner):
         if not self.is_open:
-            print(f"⚠️ Cannot attach scanner: {self.name} is closed")
+            log.debug("Cannot attach scanner: %s is closed", self.name)
             return False
         if self.attached_scanner is None:
             self.attached_scanner = scanner
             scanner.attached_bag = self
             scanner.hide()
             self.canvas.itemconfig(self.shape_id, outline="blue")
-            print(f"✅ Scanner added to {self.name}")
+            log.debug("Scanner added to %s", self.name)
             return True
         else:
-            print(f"⚠️ {self.name} already has a scanner")
+            log.debug("%s already has a scanner", self.name)
             return False
 
     def remove_scanner(self):
         if self.attached_scanner:
             self.attached_scanner.attached_bag = None
-            x1, y1, x2, y2 = self.canvas.bbox(self.shape_id)
+            x1, y1, x2, y2 = self._bbox()
             cx = x2 + 40
             cy = (y1 + y2) / 2
             self.attached_scanner.show(cx, cy)
@@ -255,32 +444,27 @@ class Bag(ClickableObject):
     # ---------- recursive delete ----------
     def delete_self(self):
         # Delete all items and their tags
-        for item in self.items[:]:
-            if item.attached_tag:
-                item.attached_tag.detach_from_item()
-                if item.attached_tag in ClickableObject.instances:
-                    ClickableObject.instances.remove(item.attached_tag)
-                if hasattr(item.attached_tag, "label_id"):
-                    self.canvas.delete(item.attached_tag.label_id)
-            if item in ClickableObject.instances:
-                ClickableObject.instances.remove(item)
-            if hasattr(item, "shape_id"):
-                self.canvas.delete(item.shape_id)
-            if hasattr(item, "label_id"):
-                self.canvas.delete(item.label_id)
-            self.items.remove(item)
+        for item in self.items:
+            tag = item.attached_tag
+            if tag:
+                tag.detach_from_item()
+                tag.delete()
+            item.delete()
+        self.items.clear()
+        self._items_set.clear()
 
         # Remove scanner if attached
         if self.attached_scanner:
             self.remove_scanner()
 
         # Remove the bag itself
-        if self in ClickableObject.instances:
-            ClickableObject.instances.remove(self)
-        if hasattr(self, "shape_id"):
-            self.canvas.delete(self.shape_id)
-        if hasattr(self, "label_id"):
-            self.canvas.delete(self.label_id)
+        self.delete()
+
+    def delete(self):
+        # a scanner must not stay attached to a bag that goes back to the pool
+        self.remove_scanner()
+        self.app.set_status("")
+        super().delete()
 
     # ---------- menu ----------
     def extend_menu(self, menu):
@@ -305,8 +489,7 @@ class Bag(ClickableObject):
             messagebox.showinfo("Remove Item", "No items to remove!")
             return
 
-        win = tk.Toplevel(self.app.root)
-        win.title(f"Remove Item from {self.name}")
+        win = self.app.reuse_dialog("remove_item", f"Remove Item from {self.name}")
         tk.Label(win, text="Select an item to remove:").pack(padx=10, pady=5)
 
         listbox = tk.Listbox(win)
@@ -320,14 +503,13 @@ class Bag(ClickableObject):
                 index = selection[0]
                 item = self.items[index]
                 self.remove_item(item)
-                win.destroy()
+                win.withdraw()
 
         tk.Button(win, text="Remove", command=remove_selected).pack(pady=5)
 
     # ---------- show contents ----------
     def show_contents(self):
-        win = tk.Toplevel(self.app.root)
-        win.title(f"Contents of {self.name}")
+        win = self.app.reuse_dialog("contents", f"Contents of {self.name}")
 
         # Scanner info
         scanner_name = self.attached_scanner.name if self.attached_scanner else "None"
@@ -374,24 +556,30 @@ class Bag(ClickableObject):
 
 
 class Item(ClickableObject):
+    __slots__ = ("attached_tag", "rfid", "hidden")
+    _SHAPE_STYLE = {"outline": "black", "width": 1}
+
     def __init__(self, app, x, y, name=None, color=None, tag=None):
         super().__init__(app, x, y, name, color)
         self.attached_tag = tag
         self.rfid = tag.rfid if tag else "No RFID"
         self.hidden = False  # to support hide/show
 
+    def _shape_coords(self, x, y):
+        return x, y, x + 40, y + 40
+
     def create_shape(self, x, y):
         self.shape_id = self.canvas.create_rectangle(
-            x, y, x + 40, y + 40,
-            fill=self.color, outline="black"
+            *self._shape_coords(x, y),
+            fill=self.color, tags=self._shape_tags(), **self._SHAPE_STYLE
         )
 
     # ---------- hide/show ----------
     def hide(self):
         if not self.hidden:
             self.hidden = True
-            self.canvas.itemconfigure(self.shape_id, state="hidden")
-            self.canvas.itemconfigure(self.label_id, state="hidden")
+            self.canvas.itemconfigure(self._group_tag, state="hidden")
+            self.app.spatial.remove(self)
             if self.attached_tag:
                 self.attached_tag.hide()
 
@@ -399,13 +587,24 @@ class Item(ClickableObject):
         if self.hidden:
             self.hidden = False
             if cx is not None and cy is not None:
-                self.canvas.coords(self.shape_id, cx, cy, cx + 40, cy + 40)
-                self.canvas.coords(self.label_id, cx + 20, cy + 20)
-            self.canvas.itemconfigure(self.shape_id, state="normal")
-            self.canvas.itemconfigure(self.label_id, state="normal")
+                self._move_to(cx, cy)
+            self.canvas.itemconfigure(self._group_tag, state="normal")
+            self.app.spatial.update(self, self._center_of_shape())
             if self.attached_tag:
                 self.attached_tag.show(cx + 50, cy + 20)
 
+    def _move_by(self, dx, dy):
+        super()._move_by(dx, dy)
+        if self.attached_tag:
+            # its canvas items already moved with our group tag
+            self.attached_tag._cx += dx
+            self.attached_tag._cy += dy
+
+    def delete(self):
+        # unlink both sides before pooling, so the tag neither drags with nor points at a reused item
+        self.remove_tag()
+        super().delete()
+
     # ---------- tag attach/remove ----------
     def attach_tag(self, tag):
         if self.attached_tag:
@@ -415,6 +614,7 @@ class Item(ClickableObject):
         tag.attached_item = self
         self.rfid = tag.rfid  # ✅ update RFID when tag is attached
         self.canvas.itemconfig(self.shape_id, outline="blue")
+        self.canvas.addtag_withtag(self._group_tag, tag._group_tag)  # tag now drags with us
 
     def remove_tag(self):
         if self.attached_tag:
@@ -423,35 +623,19 @@ class Item(ClickableObject):
             tag.attached_item = None
             self.rfid = "No RFID"  # ✅ update RFID when tag is removed
             self.canvas.itemconfig(self.shape_id, outline="black")
+            self.canvas.dtag(tag._group_tag, self._group_tag)
             # show tag again beside the item
-            bbox = self.canvas.bbox(self.shape_id)
-            if bbox:
-                x1, y1, x2, y2 = bbox
-                cx = x2 + 30
-                cy = (y1 + y2) / 2
-                tag.show(cx, cy)
+            x1, y1, x2, y2 = self._bbox()
+            cx = x2 + 30
+            cy = (y1 + y2) / 2
+            tag.show(cx, cy)
     # ---------- menu ----------
     def extend_menu(self, menu):
         if self.attached_tag:
             menu.add_command(label="Remove Tag", command=self.remove_tag)
 
         # Find the nearest bag regardless of open/closed
-        nearest_bag = None
-        center = self._center_of_shape()
-        if center:
-            ix, iy = center
-            nearest_dist = 80
-            for obj in ClickableObject.instances:
-                if isinstance(obj, Bag):
-                    bbox = obj._center_of_shape()
-                    if bbox is None:
-                        continue
-                    bx, by = bbox
-                    dist = ((ix - bx) ** 2 + (iy - by) ** 2) ** 0.5
-                    if dist < nearest_dist:
-                        nearest_bag = obj
-                        nearest_dist = dist
-
+        nearest_bag = self.app.spatial.nearest(*self._center_of_shape(), Bag, 80)
         if nearest_bag:
             def try_add():
                 if not nearest_bag.is_open:
@@ -478,82 +662,51 @@ class Item(ClickableObject):
 
     # ---------- find nearest bag ----------
     def find_nearest_bag(self, max_distance=80):
-        center = self._center_of_shape()
-        if center is None:
-            return None
-        ix, iy = center
-        nearest = None
-        nearest_dist = max_distance
-        for obj in ClickableObject.instances:
-            if isinstance(obj, Bag) and obj.is_open:
-                bbox = obj._center_of_shape()
-                if bbox is None:
-                    continue
-                bx, by = bbox
-                dist = ((ix - bx) ** 2 + (iy - by) ** 2) ** 0.5
-                if dist < nearest_dist:
-                    nearest = obj
-                    nearest_dist = dist
-        return nearest
-
-    # ---------- dragging ----------
-    def do_drag(self, event):
-        dx = event.x - self._drag_data["x"]
-        dy = event.y - self._drag_data["y"]
-        self.canvas.move(self.shape_id, dx, dy)
-        self.canvas.move(self.label_id, dx, dy)
-
-        if self.attached_tag:
-            self.canvas.move(self.attached_tag.shape_id, dx, dy)
-            self.canvas.move(self.attached_tag.label_id, dx, dy)
-
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
-
-    # ---------- helper ----------
-    def _center_of_shape(self):
-        bbox = self.canvas.bbox(self.shape_id)
-        if bbox is None:
-            return None
-        x1, y1, x2, y2 = bbox
-        return ((x1 + x2) / 2, (y1 + y2) / 2)
+        return self.app.spatial.nearest(
+            *self._center_of_shape(), Bag, max_distance, accept=lambda bag: bag.is_open
+        )
 
 
 class Tag(ClickableObject):
+    __slots__ = ("attached_item", "hidden", "rfid")
+    _SHAPE_STYLE = {"outline": "black", "width": 1}
+
     def __init__(self, app, x, y, name=None, color=None, rfid=None):
         super().__init__(app, x, y, name, color)
         self.attached_item = None
         self.hidden = False
         self.rfid = rfid or f"RFID-{random.randint(1000, 9999)}"  # unique identifier
 
-    def create_shape(self, x, y):
+    def _shape_coords(self, x, y):
         r = 20
+        return x - r, y - r, x + r, y + r
+
+    def create_shape(self, x, y):
         self.shape_id = self.canvas.create_oval(
-            x - r, y - r, x + r, y + r,
-            fill=self.color, outline="black"
+            *self._shape_coords(x, y),
+            fill=self.color, tags=self._shape_tags(), **self._SHAPE_STYLE
         )
 
     def hide(self):
         if not self.hidden:
             self.hidden = True
-            self.canvas.itemconfigure(self.shape_id, state="hidden")
-            self.canvas.itemconfigure(self.label_id, state="hidden")
+            self.canvas.itemconfigure(self._group_tag, state="hidden")
+            self.app.spatial.remove(self)
 
     def show(self, cx=None, cy=None):
         if self.hidden:
             self.hidden = False
             if cx is not None and cy is not None:
-                r = 20
-                self.canvas.coords(self.shape_id, cx - r, cy - r, cx + r, cy + r)
-                self.canvas.coords(self.label_id, cx, cy)
-            self.canvas.itemconfigure(self.shape_id, state="normal")
-            self.canvas.itemconfigure(self.label_id, state="normal")
+                self._move_to(cx, cy)
+            self.canvas.itemconfigure(self._group_tag, state="normal")
+            self.app.spatial.update(self, self._center_of_shape())
 
     def attach_to_item(self, item):
         if self.attached_item is None and item.attached_tag is None:
             self.attached_item = item
             item.attached_tag = self
             self.canvas.itemconfig(item.shape_id, outline="blue")
+            self.canvas.addtag_withtag(item._group_tag, self._group_tag)  # drag with the item
             self.hide()
 
     def detach_from_item(self):
@@ -562,13 +715,17 @@ class Tag(ClickableObject):
             self.attached_item = None
             item.attached_tag = None
             self.canvas.itemconfig(item.shape_id, outline="black")
+            self.canvas.dtag(self._group_tag, item._group_tag)
             # reappear next to item
-            bbox = self.canvas.bbox(item.shape_id)
-            if bbox:
-                x1, y1, x2, y2 = bbox
-                cx = x2 + 30
-                cy = (y1 + y2) / 2
-                self.show(cx, cy)
+            x1, y1, x2, y2 = item._bbox()
+            cx = x2 + 30
+            cy = (y1 + y2) / 2
+            self.show(cx, cy)
+
+    def delete(self):
+        # drop the item's group tag and its attached_tag link before we are pooled
+        self.detach_from_item()
+        super().delete()
 
     def extend_menu(self, menu):
         if self.attached_item is None:
@@ -588,33 +745,15 @@ class Tag(ClickableObject):
                             f"RFID: {self.rfid}")
 
     def find_nearest_item(self, max_distance=60):
-        center = self._center_of_shape()
-        if center is None:
-            return None
-        tx, ty = center
-        nearest = None
-        nearest_dist = max_distance
-        for obj in ClickableObject.instances:
-            if isinstance(obj, Item) and obj.attached_tag is None:
-                item_center = obj._center_of_shape()
-                if item_center is None:
-                    continue
-                cx, cy = item_center
-                dist = ((tx - cx) ** 2 + (ty - cy) ** 2) ** 0.5
-                if dist < nearest_dist:
-                    nearest = obj
-                    nearest_dist = dist
-        return nearest
-
-    def _center_of_shape(self):
-        bbox = self.canvas.bbox(self.shape_id)
-        if bbox is None:
-            return None
-        x1, y1, x2, y2 = bbox
-        return ((x1 + x2) / 2, (y1 + y2) / 2)
+        return self.app.spatial.nearest(
+            *self._center_of_shape(), Item, max_distance, accept=lambda item: item.attached_tag is None
+        )
 
 
 class Scanner(ClickableObject):
+    __slots__ = ("attached_bag", "hidden", "scanned_rfids", "bag_added_rfids")
+    _SHAPE_STYLE = {"outline": "black", "width": 1}
+
     def __init__(self, app, x, y, name=None, color=None):
         super().__init__(app, x, y, name, color)
         self.attached_bag = None
@@ -622,26 +761,28 @@ class Scanner(ClickableObject):
         self.scanned_rfids = set()  # only RFIDs added via bag
         self.bag_added_rfids = {}   # {Bag.name: set(RFIDs added via this bag)}
 
+    def _shape_coords(self, x, y):
+        return x, y, x + 100, y + 40
+
     def create_shape(self, x, y):
         self.shape_id = self.canvas.create_rectangle(
-            x, y, x + 100, y + 40, fill=self.color
+            *self._shape_coords(x, y), fill=self.color, tags=self._shape_tags(), **self._SHAPE_STYLE
         )
 
     # ---------- hide/show ----------
     def hide(self):
         if not self.hidden:
             self.hidden = True
-            self.canvas.itemconfig(self.shape_id, state="hidden")
-            self.canvas.itemconfig(self.label_id, state="hidden")
+            self.canvas.itemconfig(self._group_tag, state="hidden")
+            self.app.spatial.remove(self)
 
     def show(self, cx=None, cy=None):
         if self.hidden:
             self.hidden = False
             if cx is not None and cy is not None:
-                self.canvas.coords(self.shape_id, cx, cy, cx + 100, cy + 40)
-                self.canvas.coords(self.label_id, cx + 50, cy + 20)
-            self.canvas.itemconfig(self.shape_id, state="normal")
-            self.canvas.itemconfig(self.label_id, state="normal")
+                self._move_to(cx, cy)
+            self.canvas.itemconfig(self._group_tag, state="normal")
+            self.app.spatial.update(self, self._center_of_shape())
 
     # ---------- attach/detach ----------
     def attach_to_bag(self, bag):
@@ -662,11 +803,15 @@ class Scanner(ClickableObject):
             self.attached_bag = None
             bag.attached_scanner = None
             bag.canvas.itemconfig(bag.shape_id, outline="green" if bag.is_open else "red")
-            x1, y1, x2, y2 = self.canvas.bbox(bag.shape_id)
+            x1, y1, x2, y2 = bag._bbox()
             cx = x2 + 40
             cy = (y1 + y2) / 2
             self.show(cx, cy)
 
+    def delete(self):
+        self.detach_from_bag()  # don't leave the bag pointing at a pooled scanner
+        super().delete()
+
     # ---------- menu ----------
     def extend_menu(self, menu):
         # If attached, offer detach
@@ -701,39 +846,20 @@ class Scanner(ClickableObject):
 
     def remove_rfids_from_bag(self, bag):
         """Remove only RFIDs that were added via this bag"""
-        rfids = self.bag_added_rfids.get(bag.name, set())
-        self.scanned_rfids -= rfids
-        self.bag_added_rfids[bag.name] = set()
+        rfids = self.bag_added_rfids.get(bag.name)
+        if rfids:
+            self.scanned_rfids -= rfids
+            rfids.clear()  # emptied in place; the set is reused by the next scan
 
     # ---------- display ----------
     def show_scanned_rfids(self):
-        win = tk.Toplevel(self.app.root)
-        win.title(f"Scanned RFIDs by {self.name}")
-        if self.scanned_rfids:
-            for rfid in self.scanned_rfids:
-                tk.Label(win, text=rfid, anchor="w").pack(fill="x", padx=5, pady=2)
-        else:
-            tk.Label(win, text="No RFIDs scanned yet.", font=("Arial", 10, "italic")).pack(padx=10, pady=5)
+        self.app.reuse_list_dialog(
+            "scanned_rfids", f"Scanned RFIDs by {self.name}", self.scanned_rfids, "No RFIDs scanned yet."
+        )
 
     # ---------- helper ----------
     def _find_nearest_bag(self, max_dist=60):
-        center = self._center_of_shape()
-        if center is None:
-            return None
-        sx, sy = center
-        nearest = None
-        nearest_dist = max_dist
-        for obj in ClickableObject.instances:
-            if isinstance(obj, Bag):
-                bbox = obj._center_of_shape()
-                if bbox is None:
-                    continue
-                bx, by = bbox
-                dist = ((sx - bx) ** 2 + (sy - by) ** 2) ** 0.5
-                if dist < nearest_dist:
-                    nearest = obj
-                    nearest_dist = dist
-        return nearest
+        return self.app.spatial.nearest(*self._center_of_shape(), Bag, max_dist)
 
     def show_info(self):
         bag_info = self.attached_bag.name if self.attached_bag else "None"
@@ -766,7 +892,7 @@ class MenuManager:
         for obj_name, cls in self.object_classes.items():
             add_menu.add_command(
                 label=obj_name,
-                command=lambda c=cls: c(self.app, 50, 50)
+                command=lambda c=cls: c.acquire(self.app, 50, 50)
             )
         menubar.add_cascade(label="Add", menu=add_menu)
         self.app.root.config(menu=menubar)
@@ -778,6 +904,11 @@ class App:
         self.root = tk.Tk()
         self.root.title("SecuRAS")
 
+        # non-modal feedback for routine actions; packed first so it keeps its row
+        self.status_label = tk.Label(self.root, anchor="w")
+        self.status_label.pack(side="bottom", fill="x")
+        self._status_after = None
+
         main_frame = tk.Frame(self.root)
         main_frame.pack(fill="both", expand=True)
 
@@ -787,6 +918,15 @@ class App:
         layer_frame = tk.Frame(main_frame, width=180)
         layer_frame.pack(side="right", fill="y")
 
+        self.selected_obj = None
+        self.wide_outlines = False  # a shape other than selected_obj may be drawn 3px wide
+        self.spatial = SpatialIndex()
+        self.item_owner = {}  # canvas item id -> ClickableObject
+        self.context_menu = tk.Menu(self.canvas, tearoff=0)
+        self._layers_dirty = False
+        self.dialogs = {}  # dialog kind -> reusable Toplevel
+        self.dialog_lists = {}  # dialog kind -> (Listbox, placeholder Label) kept inside it
+
         tk.Label(layer_frame, text="Layers", font=("Arial", 12, "bold")).pack()
         self.layer_listbox = tk.Listbox(layer_frame)
         self.layer_listbox.pack(fill="both", expand=True, padx=5, pady=5)
@@ -796,6 +936,80 @@ class App:
         self.layer_listbox.bind("<<ListboxSelect>>", self.on_layer_select)
         self.canvas.bind("<Button-1>", self.unfocus, add="+")
 
+        # bound once for every object instead of per canvas item
+        self.canvas.tag_bind("clickable", "<Button-3>", lambda e: self._dispatch(e, "show_menu"))
+        self.canvas.tag_bind("clickable", "<Button-1>", lambda e: self._dispatch(e, "on_select"))
+        self.canvas.tag_bind("clickable", "<B1-Motion>", lambda e: self._dispatch(e, "do_drag"))
+
+    def _dispatch(self, event, method):
+        current = self.canvas.find_withtag("current")
+        obj = self.item_owner.get(current[0]) if current else None
+        if obj is not None:
+            getattr(obj, method)(event)
+
+    def set_status(self, text, timeout_ms=4000):
+        # messages clear themselves so the status line never outlives what it describes
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+            self._status_after = None
+        self.status_label.config(text=text)
+        if text:
+            self._status_after = self.root.after(timeout_ms, self.set_status, "")
+
+    def reuse_dialog(self, kind, title, clear=True):
+        # closing only withdraws the window, so reopening skips creating a new Toplevel
+        win = self.dialogs.get(kind)
+        if win is None:
+            win = tk.Toplevel(self.root)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self.dialogs[kind] = win
+        else:
+            if clear:
+                for child in win.winfo_children():
+                    child.destroy()
+            win.deiconify()
+            win.lift()
+        win.title(title)
+        return win
+
+    def reuse_list_dialog(self, kind, title, rows, empty_text):
+        # a reused dialog whose one Listbox is refilled with a single batched insert;
+        # with no rows an italic placeholder Label takes its place
+        win = self.reuse_dialog(kind, title, clear=False)
+        parts = self.dialog_lists.get(kind)
+        if parts is None:
+            parts = (tk.Listbox(win, width=30), tk.Label(win, font=("Arial", 10, "italic")))
+            self.dialog_lists[kind] = parts
+        listbox, placeholder = parts
+        listbox.delete(0, tk.END)
+        if rows:
+            placeholder.pack_forget()
+            listbox.insert(tk.END, *rows)
+            listbox.pack(fill="both", expand=True, padx=5, pady=5)
+        else:
+            listbox.pack_forget()
+            placeholder.config(text=empty_text)
+            placeholder.pack(padx=10, pady=5)
+
+    def mark_layers_dirty(self):
+        # renames/deletes are folded into one listbox rebuild on the next idle tick
+        if not self._layers_dirty:
+            self._layers_dirty = True
+            self.root.after_idle(self._rebuild_layers)
+
+    def _rebuild_layers(self):
+        self._layers_dirty = False
+        listbox = self.layer_listbox
+        top, _ = listbox.yview()  # refilling would otherwise scroll back to the first row
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *(obj.name for obj in ClickableObject.instances))
+        listbox.yview_moveto(top)
+        if self.selected_obj is not None:
+            idx = self.selected_obj._current_index()
+            listbox.selection_set(idx)
+            listbox.activate(idx)
+            listbox.see(idx)
+
     def on_layer_select(self, event):
         selection = self.layer_listbox.curselection()
         if not selection:
@@ -803,17 +1017,26 @@ class App:
         idx = selection[0]
         if 0 <= idx < len(ClickableObject.instances):
             obj = ClickableObject.instances[idx]
-            for o in ClickableObject.instances:
-                self.canvas.itemconfig(o.shape_id, width=1)
-            self.canvas.itemconfig(obj.shape_id, width=3)
-            obj._create_or_update_label()
+            self.set_selected(obj)
 
     def unfocus(self, event):
         clicked = self.canvas.find_withtag("current")
         if not clicked:
             self.layer_listbox.selection_clear(0, tk.END)
-            for obj in ClickableObject.instances:
-                self.canvas.itemconfig(obj.shape_id, width=1)
+            self.canvas.itemconfig("selectable", width=1)
+            self.wide_outlines = False
+            self.selected_obj = None
+
+    def set_selected(self, obj):
+        if obj is self.selected_obj and not self.wide_outlines:
+            return  # re-selecting: only obj is 3 wide already
+        # not just the previous selection: a new Bag starts with a 3px outline too;
+        # one tagged call resets them all
+        self.canvas.itemconfig("selectable", width=1)
+        self.wide_outlines = False
+        if obj is not None:
+            self.canvas.itemconfig(obj.shape_id, width=3)
+        self.selected_obj = obj
 
     def run(self):
         self.root.mainloop()